@@ -1,52 +1,142 @@
-import importlib
-import subprocess
-import sys
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 import fastf1
 import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
 from matplotlib.collections import LineCollection
 import numpy as np
-import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
-def compare_race_laps(year: int = 2021, gp: str = 'abu dhabi', driver_1: str = 'VER', driver_2: str = 'HAM', lap_num: int = -1) -> None:
-    """Compare the fastest laps of two drivers for a given F1 session
+# Cache fastf1 downloads on disk so repeat sessions skip network I/O
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.fastf1_cache')
+os.makedirs(_CACHE_DIR, exist_ok=True)
+fastf1.Cache.enable_cache(_CACHE_DIR)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_session(year: int, gp: str, session_type: str):
+    """Load a session once and memoize it by (year, gp, session_type)
     Args:
         year (int): The season year (e.g. 2025)
         gp (str): Grand Prix name (e.g., 'monaco', 'silverstone')
-        driver_1 (str): Three-letter identifier for driver_1 (e.g., 'VER') 
-        driver_2 (str): Three-letter identifier for driver_2 (e.g., 'HAM')
+        session_type (str): Session code ('FP1', 'FP2', 'FP3', 'Q', 'S', 'SS', 'SQ', 'R')
     """
-    # Create session 
-    session = fastf1.get_session(year, gp, 'R')
+    session = fastf1.get_session(year, gp, session_type)
     session.load()
 
-    # Select fastest lap for driver_1 and driver_2
-    laps_driver_1 = session.laps.pick_drivers(driver_1)
-    laps_driver_2 = session.laps.pick_drivers(driver_2)
+    # Store the repeated string columns as categories; halves their memory and
+    # turns the driver filters into integer-code comparisons
+    for col in ('Driver', 'Team', 'Compound'):
+        if col in session.laps.columns:
+            session.laps[col] = session.laps[col].astype('category')
+
+    return session
+
+
+def _nearest_indices(dist: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    """Find the index of the nearest value in a sorted array for each query
+    Args:
+        dist (np.ndarray): Sorted 1-D array of distances
+        queries (np.ndarray): Distances to look up
+    """
+    if njit is not None:
+        return _nearest_indices_jit(dist, queries)
+    idxs = np.searchsorted(dist, queries)
+    idxs = np.clip(idxs, 1, len(dist) - 1)
+    left = dist[idxs - 1]
+    right = dist[idxs]
+    idxs -= (queries - left) < (right - queries)
+    return idxs
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _nearest_indices_jit(dist, queries):
+        out = np.empty(queries.size, np.int64)
+        for i in range(queries.size):
+            j = np.searchsorted(dist, queries[i])
+            if j == 0:
+                out[i] = 0
+            elif j >= dist.size:
+                out[i] = dist.size - 1
+            elif (dist[j] - queries[i]) < (queries[i] - dist[j - 1]):
+                out[i] = j
+            else:
+                out[i] = j - 1
+        return out
+
+
+def _interp_telemetry(telemetry, common_distance: np.ndarray) -> dict:
+    """Resample the telemetry columns used downstream onto a common distance array
+    Args:
+        telemetry: Telemetry frame with unique, sorted 'Distance' values
+        common_distance (np.ndarray): Distances to resample onto
+    """
+    dist = telemetry['Distance'].to_numpy()
+    return {
+        col: np.interp(common_distance, dist, telemetry[col].to_numpy())
+        for col in ('X', 'Y', 'Speed')
+    }
+
+
+def _dedup_distance(telemetry):
+    """Drop rows with repeated 'Distance' values, keeping the first of each run
+    Args:
+        telemetry: Telemetry frame with sorted 'Distance' values
+    """
+    dist = telemetry['Distance'].to_numpy()
+    if np.all(dist[1:] > dist[:-1]):
+        return telemetry
+    keep = np.empty(dist.size, dtype=bool)
+    keep[0] = True
+    keep[1:] = dist[1:] != dist[:-1]
+    return telemetry[keep]
 
-    if lap_num >= 0 and lap_num <= session.total_laps:
-        fastest_lap_driver_1 = laps_driver_1.pick_laps(lap_num)
-        fastest_lap_driver_2 = laps_driver_2.pick_laps(lap_num)
-    else:
-        fastest_lap_driver_1 = laps_driver_1.pick_fastest()
-        fastest_lap_driver_2 = laps_driver_2.pick_fastest()    
 
-    # Retrieve telemetry data
-    telemetry_driver_1 = fastest_lap_driver_1.get_telemetry().add_distance()
-    telemetry_driver_2 = fastest_lap_driver_2.get_telemetry().add_distance()
+def _format_lap_time(lap_time) -> str:
+    """Format a lap time as mm:ss.mmm
+    Args:
+        lap_time: Lap time as a timedelta-like value
+    """
+    ns = int(np.timedelta64(lap_time, 'ns').astype(np.int64))
+    minutes, rem = divmod(ns, 60_000_000_000)
+    seconds, rem = divmod(rem, 1_000_000_000)
+    milliseconds = rem // 1_000_000
+    return f"{minutes:02}:{seconds:02}.{milliseconds:03}"
+
+
+def _compare_laps(session, driver_1: str, driver_2: str, lap_driver_1, lap_driver_2, plot_title: str, track_title: str) -> None:
+    """Plot side-by-side telemetry traces and track dominance for two selected laps
+    Args:
+        session: Loaded fastf1 session the laps belong to
+        driver_1 (str): Three-letter identifier for driver_1 (e.g., 'VER')
+        driver_2 (str): Three-letter identifier for driver_2 (e.g., 'HAM')
+        lap_driver_1: Selected lap for driver_1
+        lap_driver_2: Selected lap for driver_2
+        plot_title (str): Title for the telemetry figure
+        track_title (str): Title for the track dominance figure
+    """
+    # Retrieve telemetry data for both drivers concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_1 = executor.submit(lambda: lap_driver_1.get_telemetry().add_distance())
+        future_2 = executor.submit(lambda: lap_driver_2.get_telemetry().add_distance())
+        telemetry_driver_1 = future_1.result()
+        telemetry_driver_2 = future_2.result()
 
     # Drop duplicate values in 'Distance'
-    telemetry_driver_1_clean = telemetry_driver_1.drop_duplicates(subset='Distance')
-    telemetry_driver_2_clean = telemetry_driver_2.drop_duplicates(subset='Distance')    
-    
+    telemetry_driver_1_clean = _dedup_distance(telemetry_driver_1)
+    telemetry_driver_2_clean = _dedup_distance(telemetry_driver_2)
+
     # Create dataframe for turns
     circuit_info = session.get_circuit_info()
     corners_df = circuit_info.corners.set_index('Number')
     corners = corners_df[['Distance']]
 
-
     # Interpolate both telemtry sets to a common distance array
     common_distance = np.linspace(
         max(telemetry_driver_1['Distance'].min(), telemetry_driver_2['Distance'].min()),
@@ -54,99 +144,84 @@ def compare_race_laps(year: int = 2021, gp: str = 'abu dhabi', driver_1: str = '
         1000
     )
 
-    interp_driver_1 = telemetry_driver_1_clean.set_index('Distance').reindex(common_distance, method='nearest').reset_index()
-    interp_driver_2 = telemetry_driver_2_clean.set_index('Distance').reindex(common_distance, method='nearest').reset_index()
+    interp_driver_1 = _interp_telemetry(telemetry_driver_1_clean, common_distance)
+    interp_driver_2 = _interp_telemetry(telemetry_driver_2_clean, common_distance)
 
-    # Compute who was faster at each point
+    # Compute who was faster at each point, as RGBA so matplotlib skips color parsing
     driver_1_faster = interp_driver_1['Speed'] > interp_driver_2['Speed']
-    colors = np.where(driver_1_faster, 'red', 'blue')
+    red = np.array([1.0, 0.0, 0.0, 1.0], dtype=np.float32)
+    blue = np.array([0.0, 0.0, 1.0, 1.0], dtype=np.float32)
+    colors = np.where(driver_1_faster[:, None], red, blue)
 
     # Append first point to the end point to close the track loop
-    x_vals = interp_driver_1['X'].to_numpy()
-    y_vals = interp_driver_1['Y'].to_numpy()
-
-    x_vals = np.append(x_vals, x_vals[0])
-    y_vals = np.append(y_vals, y_vals[0])
-
-    points = np.array([x_vals, y_vals]).T.reshape(-1, 1, 2)
-
-    # Create segments for LineCollection
-    segments = np.concatenate([points[:-1], points[1:]], axis=1)
+    n_points = interp_driver_1['X'].size
+    points = np.empty((n_points + 1, 2), dtype=np.float64)
+    points[:n_points, 0] = interp_driver_1['X']
+    points[:n_points, 1] = interp_driver_1['Y']
+    points[n_points] = points[0]
+
+    # Create segments for LineCollection as a zero-copy sliding window view
+    segments = np.lib.stride_tricks.sliding_window_view(points, (2, 2))[:, 0]
     lc = LineCollection(segments, colors=colors[:-1], linewidths=4)
 
     # Find drivers' lap time and format it
-    d1_fastest_lap = fastest_lap_driver_1.LapTime.values[0]
-    d2_fastest_lap = fastest_lap_driver_2.LapTime.values[0]
-
-    d1_fastest_lap_pd = pd.to_timedelta(d1_fastest_lap)
-    d2_fastest_lap_pd = pd.to_timedelta(d2_fastest_lap)
-
-    d1_fastest_lap_formatted = d1_fastest_lap_pd.components
-    d2_fastest_lap_formatted = d2_fastest_lap_pd.components
-
-    d1_fastest_lap_str = f"{d1_fastest_lap_formatted.minutes:02}:{d1_fastest_lap_formatted.seconds:02}.{int(d1_fastest_lap_formatted.milliseconds):03}"
-    d2_fastest_lap_str = f"{d2_fastest_lap_formatted.minutes:02}:{d2_fastest_lap_formatted.seconds:02}.{int(d2_fastest_lap_formatted.milliseconds):03}"
+    d1_fastest_lap_str = _format_lap_time(lap_driver_1.LapTime)
+    d2_fastest_lap_str = _format_lap_time(lap_driver_2.LapTime)
 
     ## Plot Telemetry Data
-    plot_title = f"{session.event.year} {session.event.EventName} - {session.name} - {driver_1} vs {driver_2}"
-    plt.rcParams['figure.figsize'] = [15,15]
-
-    fig, ax = plt.subplots(6)
+    fig, ax = plt.subplots(6, 1, figsize=(15, 15), sharex=True, constrained_layout=False)
 
     ax[0].title.set_text(plot_title)
-    # BrakeBalance trace
-    ax[0].plot(telemetry_driver_1['Distance'], telemetry_driver_1['Brake'], label=driver_1, color='red')
-    ax[0].plot(telemetry_driver_2['Distance'], telemetry_driver_2['Brake'], label=driver_2, color='blue')
-    ax[0].set(ylabel = 'Brake')
-
-    # CarSpeed trace
-    ax[1].plot(telemetry_driver_1['Distance'], telemetry_driver_1['Speed'], label=driver_1, color='red')
-    ax[1].plot(telemetry_driver_2['Distance'], telemetry_driver_2['Speed'], label=driver_2, color='blue')
-    ax[1].set(ylabel = 'Speed [km/h]')
-
-    # DRS Rear Wing Activated
-    ax[2].plot(telemetry_driver_1['Distance'], telemetry_driver_1['DRS'], label=driver_1, color='red')
-    ax[2].plot(telemetry_driver_2['Distance'], telemetry_driver_2['DRS'], label=driver_2, color='blue')
-    ax[2].set(ylabel = 'DRS Activated')
-
-    # EngineRevs trace
-    ax[3].plot(telemetry_driver_1['Distance'], telemetry_driver_1['RPM'], label=driver_1, color='red')
-    ax[3].plot(telemetry_driver_2['Distance'], telemetry_driver_2['RPM'], label=driver_2, color='blue')
-    ax[3].set(ylabel = 'Revs per minute')
-
-    # GearNumber trace
-    ax[4].plot(telemetry_driver_1['Distance'], telemetry_driver_1['nGear'], label=driver_1, color='red')
-    ax[4].plot(telemetry_driver_2['Distance'], telemetry_driver_2['nGear'], label=driver_2, color='blue')
-    ax[4].set(ylabel = 'Gear Number')
-
-    # Throttle trace
-    ax[5].plot(telemetry_driver_1['Distance'], telemetry_driver_1['Throttle'], label=driver_1, color='red')
-    ax[5].plot(telemetry_driver_2['Distance'], telemetry_driver_2['Throttle'], label=driver_2, color='blue')
-    ax[5].set(ylabel = 'Throttle')
+
+    # Brake, Speed, DRS, RPM, Gear and Throttle traces
+    x1 = telemetry_driver_1['Distance'].to_numpy()
+    x2 = telemetry_driver_2['Distance'].to_numpy()
+
+    # Decimate the plotted traces; beyond ~2000 vertices the extra detail is invisible
+    idx1 = np.linspace(0, len(x1) - 1, min(len(x1), 2000)).astype(int)
+    idx2 = np.linspace(0, len(x2) - 1, min(len(x2), 2000)).astype(int)
+    x1 = x1[idx1]
+    x2 = x2[idx2]
+
+    channels = [
+        ('Brake', 'Brake'),
+        ('Speed', 'Speed [km/h]'),
+        ('DRS', 'DRS Activated'),
+        ('RPM', 'Revs per minute'),
+        ('nGear', 'Gear Number'),
+        ('Throttle', 'Throttle'),
+    ]
+
+    for axis, (channel, ylabel) in zip(ax, channels):
+        axis.plot(x1, telemetry_driver_1[channel].to_numpy()[idx1], label=driver_1, color='red')
+        axis.plot(x2, telemetry_driver_2[channel].to_numpy()[idx2], label=driver_2, color='blue')
+        axis.set(ylabel = ylabel)
 
     ax[5].set(xlabel = "Distance [m]")
     plt.legend(fontsize='15');
 
-    
-    for num, (i, row) in enumerate(corners.iterrows(), start=1):
-        distance = row['Distance']
+    # Freeze the limits so the corner markers don't trigger an autoscale pass each
+    corner_dists = corners['Distance'].to_numpy()
+    for axis in ax:
+        ymin, ymax = axis.get_ylim()
+        axis.set_autoscale_on(False)
+        axis.vlines(corner_dists, ymin, ymax, colors='gray', linestyles='--', alpha=0.6)
+
+    label_y = ax[0].get_ylim()[1]*0.95
+    for num, distance in enumerate(corner_dists, start=1):
         for axis in ax:
-            axis.axvline(x=distance, color='gray', linestyle='--', alpha=0.6)
-            axis.text(distance, ax[0].get_ylim()[1]*0.95, f'T{num}', fontsize=8)
+            axis.text(distance, label_y, f'T{num}', fontsize=8)
 
     # Plot track
     fig, ax = plt.subplots(figsize=(14,10))
     ax.add_collection(lc)
     ax.plot(telemetry_driver_1_clean['X'], telemetry_driver_1_clean['Y'], alpha=0)
-    ax.set_title(f'Track Dominance: {driver_1} vs {driver_2} for Lap {lap_num}', fontsize=20)
+    ax.set_title(track_title, fontsize=20)
     ax.axis('off')
 
-    corner_pos = []
-    for num, row in corners.iterrows():
-        idx = (telemetry_driver_1['Distance'] - row['Distance']).abs().idxmin()
-        pos = telemetry_driver_1.loc[idx, ['X', 'Y']]
-        corner_pos.append((num, pos['X'], pos['Y']))
-
+    corner_idxs = _nearest_indices(telemetry_driver_1['Distance'].to_numpy(), corners['Distance'].to_numpy())
+    corner_xy = telemetry_driver_1[['X', 'Y']].to_numpy()[corner_idxs]
+    corner_pos = list(zip(corners.index, corner_xy[:, 0], corner_xy[:, 1]))
 
     for num, x, y, in corner_pos:
         plt.plot(x, y, 'o', color='red')
@@ -160,10 +235,10 @@ def compare_race_laps(year: int = 2021, gp: str = 'abu dhabi', driver_1: str = '
 
     sector_dist = np.linspace(track_min, track_max, n_sectors+1)[1:-1]
 
-    for i in sector_dist:
-        idx = (interp_driver_1['Distance'] -  i).abs().idxmin()
-        x, y = interp_driver_1.loc[idx, ['X', 'Y']]
-        ax.plot(x,y, marker='x', color='gray', alpha=0.3)
+    sector_idxs = _nearest_indices(common_distance, sector_dist)
+
+    for x, y in zip(interp_driver_1['X'][sector_idxs], interp_driver_1['Y'][sector_idxs]):
+        ax.plot(x, y, marker='x', color='gray', alpha=0.3)
 
     # Add legend
     driver_1_name = session.get_driver(driver_1)['LastName']
@@ -173,162 +248,53 @@ def compare_race_laps(year: int = 2021, gp: str = 'abu dhabi', driver_1: str = '
     ax.legend(handles=legend, loc='best', fontsize=16);
 
 
-
-
-def compare_fastest_laps(year: int = 2021, gp: str = 'abu dhabi', session_type: str = 'Q', driver_1: str = 'VER', driver_2: str = 'HAM') -> None:
+def compare_race_laps(year: int = 2021, gp: str = 'abu dhabi', driver_1: str = 'VER', driver_2: str = 'HAM', lap_num: int = -1) -> None:
     """Compare the fastest laps of two drivers for a given F1 session
     Args:
         year (int): The season year (e.g. 2025)
         gp (str): Grand Prix name (e.g., 'monaco', 'silverstone')
-        session_type (str): Session code ('FP1', 'FP2', 'FP3', 'Q', 'S', 'SS', 'SQ', 'R')
-        driver_1 (str): Three-letter identifier for driver_1 (e.g., 'VER') 
+        driver_1 (str): Three-letter identifier for driver_1 (e.g., 'VER')
         driver_2 (str): Three-letter identifier for driver_2 (e.g., 'HAM')
     """
-    # Create session 
-    session = fastf1.get_session(year, gp, session_type)
-    session.load()
+    # Create session
+    session = _get_session(year, gp, 'R')
 
-    # Select fastest lap for driver_1 and driver_2
-    laps_driver_1 = session.laps.pick_drivers(driver_1)
-    laps_driver_2 = session.laps.pick_drivers(driver_2)
-
-    fastest_lap_driver_1 = laps_driver_1.pick_fastest()
-    fastest_lap_driver_2 = laps_driver_2.pick_fastest()
+    # Select the requested lap (or the fastest lap) for driver_1 and driver_2
+    laps = session.laps.pick_drivers([driver_1, driver_2])
+    laps_driver_1 = laps[laps['Driver'] == driver_1]
+    laps_driver_2 = laps[laps['Driver'] == driver_2]
 
-    # Retrieve telemetry data
-    telemetry_driver_1 = fastest_lap_driver_1.get_telemetry().add_distance()
-    telemetry_driver_2 = fastest_lap_driver_2.get_telemetry().add_distance()
-
-    # Drop duplicate values in 'Distance'
-    telemetry_driver_1_clean = telemetry_driver_1.drop_duplicates(subset='Distance')
-    telemetry_driver_2_clean = telemetry_driver_2.drop_duplicates(subset='Distance')    
-    
-    # Create dataframe for turns
-    circuit_info = session.get_circuit_info()
-    corners_df = circuit_info.corners.set_index('Number')
-    corners = corners_df[['Distance']]
-
-
-    # Interpolate both telemtry sets to a common distance array
-    common_distance = np.linspace(
-        max(telemetry_driver_1['Distance'].min(), telemetry_driver_2['Distance'].min()),
-        min(telemetry_driver_1['Distance'].max(), telemetry_driver_2['Distance'].max()),
-        1000
-    )
-
-    interp_driver_1 = telemetry_driver_1_clean.set_index('Distance').reindex(common_distance, method='nearest').reset_index()
-    interp_driver_2 = telemetry_driver_2_clean.set_index('Distance').reindex(common_distance, method='nearest').reset_index()
-
-    # Compute who was faster at each point
-    driver_1_faster = interp_driver_1['Speed'] > interp_driver_2['Speed']
-    colors = np.where(driver_1_faster, 'red', 'blue')
-
-    # Append first point to the end point to close the track loop
-    x_vals = interp_driver_1['X'].to_numpy()
-    y_vals = interp_driver_1['Y'].to_numpy()
-
-    x_vals = np.append(x_vals, x_vals[0])
-    y_vals = np.append(y_vals, y_vals[0])
-
-    points = np.array([x_vals, y_vals]).T.reshape(-1, 1, 2)
+    if lap_num >= 0 and lap_num <= session.total_laps:
+        lap_driver_1 = laps_driver_1.pick_laps(lap_num).iloc[0]
+        lap_driver_2 = laps_driver_2.pick_laps(lap_num).iloc[0]
+    else:
+        lap_driver_1 = laps_driver_1.pick_fastest()
+        lap_driver_2 = laps_driver_2.pick_fastest()
 
-    # Create segments for LineCollection
-    segments = np.concatenate([points[:-1], points[1:]], axis=1)
-    lc = LineCollection(segments, colors=colors[:-1], linewidths=4)
+    plot_title = f"{session.event.year} {session.event.EventName} - {session.name} - {driver_1} vs {driver_2}"
+    track_title = f'Track Dominance: {driver_1} vs {driver_2} for Lap {lap_num}'
 
-    # Print drivers' fastest lap and difference between them
-    d1_fastest_lap = fastest_lap_driver_1.LapTime
-    d2_fastest_lap = fastest_lap_driver_2.LapTime
+    _compare_laps(session, driver_1, driver_2, lap_driver_1, lap_driver_2, plot_title, track_title)
 
-    d1_fastest_lap_pd = pd.to_timedelta(d1_fastest_lap)
-    d2_fastest_lap_pd = pd.to_timedelta(d2_fastest_lap)
 
-    d1_fastest_lap_formatted = d1_fastest_lap_pd.components
-    d2_fastest_lap_formatted = d2_fastest_lap_pd.components
+def compare_fastest_laps(year: int = 2021, gp: str = 'abu dhabi', session_type: str = 'Q', driver_1: str = 'VER', driver_2: str = 'HAM') -> None:
+    """Compare the fastest laps of two drivers for a given F1 session
+    Args:
+        year (int): The season year (e.g. 2025)
+        gp (str): Grand Prix name (e.g., 'monaco', 'silverstone')
+        session_type (str): Session code ('FP1', 'FP2', 'FP3', 'Q', 'S', 'SS', 'SQ', 'R')
+        driver_1 (str): Three-letter identifier for driver_1 (e.g., 'VER')
+        driver_2 (str): Three-letter identifier for driver_2 (e.g., 'HAM')
+    """
+    # Create session
+    session = _get_session(year, gp, session_type)
 
-    d1_fastest_lap_str = f"{d1_fastest_lap_formatted.minutes:02}:{d1_fastest_lap_formatted.seconds:02}.{int(d1_fastest_lap_formatted.milliseconds):03}"
-    d2_fastest_lap_str = f"{d2_fastest_lap_formatted.minutes:02}:{d2_fastest_lap_formatted.seconds:02}.{int(d2_fastest_lap_formatted.milliseconds):03}"
+    # Select fastest lap for driver_1 and driver_2
+    laps = session.laps.pick_drivers([driver_1, driver_2])
+    lap_driver_1 = laps[laps['Driver'] == driver_1].pick_fastest()
+    lap_driver_2 = laps[laps['Driver'] == driver_2].pick_fastest()
 
-    ## Plot Telemetry Data
     plot_title = f"{session.event.year} {session.event.EventName} - {session.name} - {driver_1} vs {driver_2} - Fastest Lap"
-    plt.rcParams['figure.figsize'] = [15,15]
-
-    fig, ax = plt.subplots(6)
-
-    ax[0].title.set_text(plot_title)
-    # BrakeBalance trace
-    ax[0].plot(telemetry_driver_1['Distance'], telemetry_driver_1['Brake'], label=driver_1, color='red')
-    ax[0].plot(telemetry_driver_2['Distance'], telemetry_driver_2['Brake'], label=driver_2, color='blue')
-    ax[0].set(ylabel = 'Brake')
-
-    # CarSpeed trace
-    ax[1].plot(telemetry_driver_1['Distance'], telemetry_driver_1['Speed'], label=driver_1, color='red')
-    ax[1].plot(telemetry_driver_2['Distance'], telemetry_driver_2['Speed'], label=driver_2, color='blue')
-    ax[1].set(ylabel = 'Speed [km/h]')
-
-    # DRS Rear Wing Activated
-    ax[2].plot(telemetry_driver_1['Distance'], telemetry_driver_1['DRS'], label=driver_1, color='red')
-    ax[2].plot(telemetry_driver_2['Distance'], telemetry_driver_2['DRS'], label=driver_2, color='blue')
-    ax[2].set(ylabel = 'DRS Activated')
-
-    # EngineRevs trace
-    ax[3].plot(telemetry_driver_1['Distance'], telemetry_driver_1['RPM'], label=driver_1, color='red')
-    ax[3].plot(telemetry_driver_2['Distance'], telemetry_driver_2['RPM'], label=driver_2, color='blue')
-    ax[3].set(ylabel = 'Revs per minute')
-
-    # GearNumber trace
-    ax[4].plot(telemetry_driver_1['Distance'], telemetry_driver_1['nGear'], label=driver_1, color='red')
-    ax[4].plot(telemetry_driver_2['Distance'], telemetry_driver_2['nGear'], label=driver_2, color='blue')
-    ax[4].set(ylabel = 'Gear Number')
-
-    # Throttle trace
-    ax[5].plot(telemetry_driver_1['Distance'], telemetry_driver_1['Throttle'], label=driver_1, color='red')
-    ax[5].plot(telemetry_driver_2['Distance'], telemetry_driver_2['Throttle'], label=driver_2, color='blue')
-    ax[5].set(ylabel = 'Throttle')
-
-    ax[5].set(xlabel = "Distance [m]")
-    plt.legend(fontsize='15');
-    
-    for num, (i, row) in enumerate(corners.iterrows(), start=1):
-        distance = row['Distance']
-        for axis in ax:
-            axis.axvline(x=distance, color='gray', linestyle='--', alpha=0.6)
-            axis.text(distance, ax[0].get_ylim()[1]*0.95, f'T{num}', fontsize=8)
-
-    # Plot track
-    fig, ax = plt.subplots(figsize=(14,10))
-    ax.add_collection(lc)
-    ax.plot(telemetry_driver_1_clean['X'], telemetry_driver_1_clean['Y'], alpha=0)
-    ax.set_title(f'Track Dominance: {driver_1} vs {driver_2} for Fastest Laps of {session.name}', fontsize=20)
-    ax.axis('off')
-
-    corner_pos = []
-    for num, row in corners.iterrows():
-        idx = (telemetry_driver_1['Distance'] - row['Distance']).abs().idxmin()
-        pos = telemetry_driver_1.loc[idx, ['X', 'Y']]
-        corner_pos.append((num, pos['X'], pos['Y']))
-
-
-    for num, x, y, in corner_pos:
-        plt.plot(x, y, 'o', color='red')
-        plt.text(x, y, f'T{num}', color='green', fontsize=15)
-
-    # Add sectors
-    track_min = common_distance.min()
-    track_max = common_distance.max()
-
-    n_sectors = 21
-
-    sector_dist = np.linspace(track_min, track_max, n_sectors+1)[1:-1]
-
-    for i in sector_dist:
-        idx = (interp_driver_1['Distance'] -  i).abs().idxmin()
-        x, y = interp_driver_1.loc[idx, ['X', 'Y']]
-        ax.plot(x,y, marker='x', color='gray', alpha=0.3)
-
-    # Add legend
-    driver_1_name = session.get_driver(driver_1)['LastName']
-    driver_2_name = session.get_driver(driver_2)['LastName']
-    legend = [Patch(facecolor='red', label=f'{driver_1_name} - {d1_fastest_lap_str}'), Patch(facecolor='blue', label=f'{driver_2_name} - {d2_fastest_lap_str}')]
+    track_title = f'Track Dominance: {driver_1} vs {driver_2} for Fastest Laps of {session.name}'
 
-    ax.legend(handles=legend, loc='best', fontsize=16);
\ No newline at end of file
+    _compare_laps(session, driver_1, driver_2, lap_driver_1, lap_driver_2, plot_title, track_title)